@@ -8,15 +8,26 @@ import sys
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
-import json
+import asyncio
 import logging
+import multiprocessing
+import os
+import secrets
+import time
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List
-from fastapi import FastAPI, BackgroundTasks, HTTPException
-from fastapi.responses import FileResponse, JSONResponse
-from pydantic import BaseModel, Field
-import uuid
+import orjson
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import FileResponse, JSONResponse, Response
+from pydantic import BaseModel, ConfigDict, Field
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sse_starlette.sse import EventSourceResponse
 
 from patentscope_scraper import PatentScopeScraper
 from patentscope_detalhes import enriquecer_patentes_com_detalhes, agrupar_por_publication_number
@@ -28,19 +39,148 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release the search process pool and Redis connections on shutdown"""
+    yield
+    # Cancelling queued searches fires their done callbacks, which mark them failed
+    executor.shutdown(wait=False, cancel_futures=True)
+    if _pending_failure_writes:
+        await asyncio.wait(
+            [asyncio.wrap_future(write) for write in list(_pending_failure_writes)],
+            timeout=5
+        )
+    await redis_client.aclose()
+
+
 # FastAPI app
 app = FastAPI(
     title="PatentScope Scraper API",
     description="REST API to search and retrieve patent data from WIPO PatentScope",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# In-memory task storage (use Redis or database in production)
-tasks = {}
+# Redis task storage: one hash per task (task:{task_id}) plus an index sorted
+# set scored by last update time, so the least recently updated tasks come first
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+TASK_TTL = 86400  # Task metadata expires after 24 hours
+MAX_TASKS = 1000  # Oldest finished tasks are evicted beyond this
+TASKS_INDEX = "tasks:all"
+TASKS_VERSION = "tasks:version"  # Bumped on every task status change
+FINISHED_STATUSES = ("completed", "failed")
+
+# Maximum number of country searches running at the same time
+MAX_PARALLEL_COUNTRIES = 4
+
+# Search processes per uvicorn worker. Every uvicorn worker has its own pool, so
+# a host runs up to WEB_CONCURRENCY * SEARCH_WORKERS searches, each with up to
+# MAX_PARALLEL_COUNTRIES Chrome instances
+SEARCH_WORKERS = int(os.getenv("SEARCH_WORKERS", 2))
+
+# orjson options for result files (UTF-8 output, same layout as json.dump(indent=2))
+JSON_FILE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+redis_client = Redis.from_url(REDIS_URL, decode_responses=True)
+
+# Serialized /tasks response, reused while TASKS_VERSION is unchanged and
+# no listed task has reached its TTL (expiry does not bump the version)
+_tasks_cache: Optional[bytes] = None
+_tasks_cache_version: Optional[str] = None
+_tasks_cache_expires_at = 0.0
+
+# /health result, refreshed at most once per second:
+# (monotonic time, ISO timestamp, Redis reachable)
+_last_hc = (float("-inf"), "", False)
+
+
+def _create_executor() -> ProcessPoolExecutor:
+    """Create the search process pool"""
+    # "spawn" avoids forking a process that already runs threads and an event loop
+    return ProcessPoolExecutor(
+        max_workers=SEARCH_WORKERS,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+# Searches run in worker processes so the API event loop stays responsive
+executor = _create_executor()
+
+# Redis writes marking dead searches as failed, awaited on shutdown
+_pending_failure_writes = set()
+
+
+def _task_key(task_id: str) -> str:
+    """Redis key for a task hash"""
+    return f"task:{task_id}"
+
+
+def _task_channel(task_id: str) -> str:
+    """Redis pub/sub channel announcing task updates"""
+    return f"task:{task_id}:events"
+
+
+async def _update_task(task_id: str, /, **fields):
+    """Set task fields in Redis (dict values are stored as JSON) and notify subscribers"""
+    mapping = {
+        key: orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS) if isinstance(value, dict) else value
+        for key, value in fields.items()
+        if value is not None
+    }
+    key = _task_key(task_id)
+    async with redis_client.pipeline() as pipe:
+        pipe.hset(key, mapping=mapping)
+        pipe.expire(key, TASK_TTL)
+        pipe.zadd(TASKS_INDEX, {task_id: time.time()})
+        pipe.publish(_task_channel(task_id), ",".join(mapping))
+        if "status" in mapping:
+            pipe.incr(TASKS_VERSION)
+        await pipe.execute()
+
+
+async def _evict_old_tasks():
+    """Evict the least recently updated finished tasks once more than MAX_TASKS are stored"""
+    excess = await redis_client.zcard(TASKS_INDEX) - MAX_TASKS
+    if excess <= 0:
+        return
+
+    oldest = await redis_client.zrange(TASKS_INDEX, 0, excess - 1)
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for task_id in oldest:
+            pipe.hget(_task_key(task_id), "status")
+        statuses = await pipe.execute()
+
+    # Queued/running tasks are kept, even if that leaves the store slightly over the limit
+    evicted = [
+        task_id for task_id, status in zip(oldest, statuses)
+        if status is None or status in FINISHED_STATUSES
+    ]
+    if evicted:
+        async with redis_client.pipeline() as pipe:
+            pipe.delete(*(_task_key(task_id) for task_id in evicted))
+            pipe.zrem(TASKS_INDEX, *evicted)
+            pipe.incr(TASKS_VERSION)
+            await pipe.execute()
+        logger.info(f"Evicted {len(evicted)} old tasks")
+
+
+async def _get_task(task_id: str) -> Optional[dict]:
+    """Load a task hash from Redis ("result" stays as the stored JSON string)"""
+    task = await redis_client.hgetall(_task_key(task_id))
+    if not task:
+        return None
+
+    if "request" in task:
+        task["request"] = orjson.loads(task["request"])
+
+    return task
 
 
 class SearchRequest(BaseModel):
     """Request model for patent search"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     term: str = Field(..., description="Search term (e.g., 'semaglutide')")
     limit: int = Field(50, description="Maximum number of patents to retrieve", ge=1, le=1000)
     countries: Optional[List[str]] = Field(None, description="List of country codes to filter (e.g., ['US', 'EP', 'WO'])")
@@ -65,82 +205,133 @@ class TaskStatus(BaseModel):
     error: Optional[str] = None
 
 
-def execute_search(task_id: str, request: SearchRequest):
+def _write_json_file(path: Path, data):
+    """Encode data with orjson and write the bytes straight to an unbuffered file descriptor"""
+    payload = memoryview(orjson.dumps(data, option=JSON_FILE_OPTIONS))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(str(path), flags, 0o644)
+    try:
+        # os.write may write fewer bytes than requested
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
+
+
+def _create_scraper(use_login: bool) -> PatentScopeScraper:
+    """Create a headless scraper with its own Selenium driver"""
+    return PatentScopeScraper(
+        headless=True,
+        use_demo_mode=False,
+        use_login=use_login
+    )
+
+
+def _search_country(request: SearchRequest, pais: str) -> List[dict]:
+    """Search one country on a dedicated scraper (Selenium drivers are not thread-safe)"""
+    scraper = _create_scraper(request.use_login)
+    try:
+        return scraper.buscar_patentes(
+            termo_busca=request.term,
+            campo='all',
+            pais=pais,
+            limite=request.limit
+        )
+    finally:
+        # Release the browser right away instead of waiting for garbage collection
+        if scraper.driver:
+            try:
+                scraper.driver.quit()
+            except Exception as e:
+                logger.warning(f"Error closing Selenium driver for {pais}: {e}")
+            scraper.driver = None
+
+
+async def execute_search(task_id: str, request: SearchRequest):
     """Background task to execute patent search"""
     try:
         logger.info(f"Starting search task {task_id} with term: {request.term}")
-        tasks[task_id]["status"] = "running"
-        tasks[task_id]["progress"] = "Initializing scraper..."
-
-        # Initialize scraper
-        scraper = PatentScopeScraper(
-            headless=True,
-            use_demo_mode=False,
-            use_login=request.use_login
-        )
+        await _update_task(task_id, status="running", progress="Initializing scraper...")
+
+        # Selenium calls are blocking, so they run in worker threads
+        scraper = None
 
         # Create results directory
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         pasta_resultados = Path("resultados") / f"patentscope_{request.term}_{timestamp}"
         pasta_resultados.mkdir(parents=True, exist_ok=True)
 
-        tasks[task_id]["progress"] = f"Searching patents for term: {request.term}"
+        await _update_task(task_id, progress=f"Searching patents for term: {request.term}")
 
-        # Execute search
-        all_patents = []
+        # Execute search (duplicates are dropped as results arrive; setdefault
+        # does the membership test and the insert with a single hash lookup)
+        unique_patents = {}
+        total_found = 0
 
         if request.countries:
-            # Search by country
-            for pais in request.countries:
-                logger.info(f"Searching in {pais}...")
-                tasks[task_id]["progress"] = f"Searching in {pais}..."
-
-                patents = scraper.buscar_patentes(
-                    termo_busca=request.term,
-                    campo='all',
-                    pais=pais,
-                    limite=request.limit
-                )
+            # Search countries concurrently, one scraper per country
+            semaphore = asyncio.Semaphore(MAX_PARALLEL_COUNTRIES)
 
-                for p in patents:
-                    p['pais_filtro'] = pais
+            async def search_country(pais: str) -> List[dict]:
+                async with semaphore:
+                    logger.info(f"Searching in {pais}...")
+                    await _update_task(task_id, progress=f"Searching in {pais}...")
+                    return await asyncio.to_thread(_search_country, request, pais)
 
-                all_patents.extend(patents)
+            results = await asyncio.gather(*(search_country(pais) for pais in request.countries))
+
+            # Merge in request order so deduplication stays deterministic
+            for pais, patents in zip(request.countries, results):
+                total_found += len(patents)
                 logger.info(f"Found {len(patents)} patents in {pais}")
+
+                for p in patents:
+                    pub_num = p.get('publicationNumber', '')
+                    if pub_num and unique_patents.setdefault(pub_num, p) is p:
+                        p['pais_filtro'] = pais
         else:
             # General search
             logger.info("Executing general search...")
-            tasks[task_id]["progress"] = "Executing general search..."
-            all_patents = scraper.buscar_patentes_simples(request.term, limite=request.limit)
-
-        # Remove duplicates
-        unique_patents = {}
-        for p in all_patents:
-            pub_num = p.get('publicationNumber', '')
-            if pub_num and pub_num not in unique_patents:
-                unique_patents[pub_num] = p
+            await _update_task(task_id, progress="Executing general search...")
+            scraper = await asyncio.to_thread(_create_scraper, request.use_login)
+            patents = await asyncio.to_thread(
+                scraper.buscar_patentes_simples, request.term, limite=request.limit
+            )
+            total_found = len(patents)
+
+            for p in patents:
+                pub_num = p.get('publicationNumber', '')
+                if pub_num:
+                    unique_patents.setdefault(pub_num, p)
 
         patents_list = list(unique_patents.values())
 
-        logger.info(f"Found {len(all_patents)} total, {len(patents_list)} unique patents")
-        tasks[task_id]["progress"] = f"Found {len(patents_list)} unique patents"
+        logger.info(f"Found {total_found} total, {len(patents_list)} unique patents")
+        await _update_task(task_id, progress=f"Found {len(patents_list)} unique patents")
 
         if len(patents_list) == 0:
-            tasks[task_id]["status"] = "completed"
-            tasks[task_id]["result"] = {
-                "message": "No patents found",
-                "total_found": 0,
-                "patents": []
-            }
+            await _update_task(
+                task_id,
+                status="completed",
+                result={
+                    "message": "No patents found",
+                    "total_found": 0,
+                    "patents": []
+                }
+            )
             return
 
         # Get complete details if requested
         if request.get_details and len(patents_list) > 0:
-            tasks[task_id]["progress"] = f"Retrieving complete details..."
+            await _update_task(task_id, progress="Retrieving complete details...")
             logger.info(f"Retrieving complete details for patents...")
 
             try:
-                patents_list = enriquecer_patentes_com_detalhes(
+                if scraper is None:
+                    scraper = await asyncio.to_thread(_create_scraper, request.use_login)
+
+                patents_list = await asyncio.to_thread(
+                    enriquecer_patentes_com_detalhes,
                     patents_list,
                     scraper.driver,
                     max_detalhes=request.max_details
@@ -148,58 +339,53 @@ def execute_search(task_id: str, request: SearchRequest):
                 logger.info("Complete details retrieved successfully")
             except Exception as e:
                 logger.error(f"Error retrieving details: {e}")
-                tasks[task_id]["progress"] = f"Error retrieving details: {str(e)}"
+                await _update_task(task_id, progress=f"Error retrieving details: {str(e)}")
 
-        # Calculate statistics
-        stats = {
-            "por_pais": {},
-            "por_ano": {},
-            "top_applicants": {},
-            "top_inventors": {}
-        }
+        # Calculate statistics (country, year, applicants, inventors) in a single pass
+        por_pais = Counter()
+        por_ano = Counter()
+        top_applicants = Counter()
+        top_inventors = Counter()
 
-        # Statistics by country
         for p in patents_list:
             pub_num = p.get('publicationNumber', '')
+            # Country codes and years repeat constantly, intern them so the
+            # counter lookups hit the identity fast path
             if pub_num and len(pub_num) >= 2:
-                country = pub_num[:2]
-                stats["por_pais"][country] = stats["por_pais"].get(country, 0) + 1
+                por_pais[sys.intern(pub_num[:2])] += 1
 
-        # Statistics by year
-        for p in patents_list:
             date = p.get('publicationDate', '')
             if date and len(date) >= 4:
-                year = date[:4]
-                stats["por_ano"][year] = stats["por_ano"].get(year, 0) + 1
+                por_ano[sys.intern(date[:4])] += 1
 
-        # Top applicants
-        for p in patents_list:
-            for app in p.get('applicants', []):
-                if app:
-                    stats["top_applicants"][app] = stats["top_applicants"].get(app, 0) + 1
+            # Only touch the counters when the patent lists applicants/inventors
+            if applicants := p.get('applicants'):
+                top_applicants.update(filter(None, applicants))
+            if inventors := p.get('inventors'):
+                top_inventors.update(filter(None, inventors))
 
-        # Top inventors
-        for p in patents_list:
-            for inv in p.get('inventors', []):
-                if inv:
-                    stats["top_inventors"][inv] = stats["top_inventors"].get(inv, 0) + 1
+        stats = {
+            "por_pais": dict(por_pais),
+            "por_ano": dict(por_ano),
+            "top_applicants": dict(top_applicants),
+            "top_inventors": dict(top_inventors)
+        }
 
         # Save results
-        tasks[task_id]["progress"] = "Saving results..."
+        await _update_task(task_id, progress="Saving results...")
 
         # Grouped patents by publication number
         patents_agrupadas = agrupar_por_publication_number(patents_list)
 
         json_file = pasta_resultados / "patents_complete.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(patents_agrupadas, f, ensure_ascii=False, indent=2)
+        _write_json_file(json_file, patents_agrupadas)
 
         # Summary with stats
         summary = {
             "search_info": {
                 "termo": request.term,
                 "data_busca": datetime.now().isoformat(),
-                "total_encontrado": len(all_patents),
+                "total_encontrado": total_found,
                 "total_unico": len(patents_list),
                 "paises_filtro": request.countries,
                 "limite": request.limit,
@@ -210,26 +396,103 @@ def execute_search(task_id: str, request: SearchRequest):
         }
 
         summary_file = pasta_resultados / "summary_with_stats.json"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        _write_json_file(summary_file, summary)
 
         logger.info(f"Search task {task_id} completed successfully")
-        tasks[task_id]["status"] = "completed"
-        tasks[task_id]["result"] = {
-            "search_info": summary["search_info"],
-            "statistics": summary["statistics"],
-            "total_patents": len(patents_list),
-            "patents": patents_list[:10],  # Return first 10 patents in response
-            "files": {
-                "json_complete": str(json_file),
-                "summary": str(summary_file)
+        await _update_task(
+            task_id,
+            status="completed",
+            result={
+                "search_info": summary["search_info"],
+                "statistics": summary["statistics"],
+                "total_patents": len(patents_list),
+                "patents": patents_list[:10],  # Return first 10 patents in response
+                "files": {
+                    "json_complete": str(json_file),
+                    "summary": str(summary_file)
+                }
             }
-        }
+        )
 
     except Exception as e:
         logger.error(f"Error in search task {task_id}: {e}", exc_info=True)
-        tasks[task_id]["status"] = "failed"
-        tasks[task_id]["error"] = str(e)
+        await _update_task(task_id, status="failed", error=str(e))
+
+
+def _task_status(task_id: str, task: dict) -> TaskStatus:
+    """Build the public status model from a stored task without a result"""
+    return TaskStatus(
+        task_id=task_id,
+        status=task["status"],
+        progress=task.get("progress"),
+        error=task.get("error")
+    )
+
+
+def _task_status_json(task_id: str, task: dict) -> bytes:
+    """Serialize a stored task status, embedding the stored result JSON as-is"""
+    result = task.get("result")
+    return orjson.dumps({
+        "task_id": task_id,
+        "status": task["status"],
+        "progress": task.get("progress"),
+        "result": orjson.Fragment(result) if result is not None else None,
+        "error": task.get("error")
+    })
+
+
+def run_search(task_id: str, request_data: dict):
+    """Process pool entry point for execute_search"""
+    global redis_client
+
+    # Each worker process talks to Redis through its own client and event loop
+    redis_client = Redis.from_url(REDIS_URL, decode_responses=True)
+
+    async def main():
+        try:
+            await execute_search(task_id, SearchRequest(**request_data))
+        finally:
+            await redis_client.aclose()
+
+    asyncio.run(main())
+
+
+def _on_search_done(task_id: str, loop: asyncio.AbstractEventLoop, future: Future):
+    """Mark searches that died outside execute_search (crashed worker, cancelled on shutdown) as failed"""
+    if future.cancelled():
+        error = "Search cancelled: API shutting down"
+    elif future.exception() is not None:
+        error = f"Search worker failed: {future.exception()!r}"
+    else:
+        return
+
+    logger.error(f"Search task {task_id}: {error}")
+
+    # Runs on the executor's manager thread, so hand the Redis write to the app loop
+    try:
+        write = asyncio.run_coroutine_threadsafe(
+            _update_task(task_id, status="failed", error=error), loop
+        )
+    except RuntimeError:
+        logger.warning(f"Event loop closed, could not mark task {task_id} as failed")
+        return
+
+    _pending_failure_writes.add(write)
+    write.add_done_callback(_pending_failure_writes.discard)
+
+
+def _submit_search(task_id: str, request_data: dict) -> Future:
+    """Submit a search to the process pool, recreating the pool once if a worker died"""
+    global executor
+
+    try:
+        return executor.submit(run_search, task_id, request_data)
+    except BrokenProcessPool:
+        # A dead worker breaks the pool for good, start a fresh one
+        logger.warning("Search process pool is broken, recreating it")
+        executor.shutdown(wait=False, cancel_futures=True)
+        executor = _create_executor()
+        return executor.submit(run_search, task_id, request_data)
 
 
 @app.get("/")
@@ -241,6 +504,8 @@ async def root():
         "endpoints": {
             "POST /search": "Execute a patent search",
             "GET /status/{task_id}": "Get search task status",
+            "GET /stream/{task_id}": "Stream search task status (Server-Sent Events)",
+            "GET /download/{task_id}/{which}": "Download a result file (json_complete or summary)",
             "GET /tasks": "List all tasks",
             "GET /health": "Health check"
         }
@@ -249,27 +514,57 @@ async def root():
 
 @app.get("/health")
 async def health():
-    """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    """Health check endpoint (also checks that Redis answers PING)"""
+    global _last_hc
+
+    now = time.monotonic()
+    if now - _last_hc[0] > 1.0:
+        try:
+            redis_ok = await asyncio.wait_for(redis_client.ping(), timeout=1.0)
+        except (RedisError, OSError, asyncio.TimeoutError) as e:
+            logger.warning(f"Health check: Redis unavailable: {e}")
+            redis_ok = False
+        _last_hc = (now, datetime.now().isoformat(), redis_ok)
+
+    _, timestamp, redis_ok = _last_hc
+    if not redis_ok:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "unhealthy", "redis": "unavailable", "timestamp": timestamp}
+        )
+
+    return {"status": "healthy", "redis": "ok", "timestamp": timestamp}
 
 
 @app.post("/search", response_model=SearchResponse)
-async def search_patents(request: SearchRequest, background_tasks: BackgroundTasks):
+async def search_patents(request: SearchRequest):
     """
     Execute a patent search
 
     Returns a task_id that can be used to check the search status
     """
-    task_id = str(uuid.uuid4())
+    task_id = secrets.token_hex(16)
+    request_data = request.model_dump(mode='json')
 
-    tasks[task_id] = {
-        "task_id": task_id,
-        "status": "queued",
-        "request": request.dict(),
-        "created_at": datetime.now().isoformat()
-    }
+    await _update_task(
+        task_id,
+        task_id=task_id,
+        status="queued",
+        request=request_data,
+        created_at=datetime.now().isoformat()
+    )
+    await _evict_old_tasks()
+
+    try:
+        future = _submit_search(task_id, request_data)
+    except RuntimeError as e:
+        # Pool still broken or shutting down: don't leave a queued task behind
+        logger.error(f"Could not start search task {task_id}: {e}")
+        await _update_task(task_id, status="failed", error=f"Could not start search: {e}")
+        raise HTTPException(status_code=503, detail="Search workers unavailable, please retry")
 
-    background_tasks.add_task(execute_search, task_id, request)
+    loop = asyncio.get_running_loop()
+    future.add_done_callback(lambda f: _on_search_done(task_id, loop, f))
 
     logger.info(f"Created search task {task_id}")
 
@@ -283,36 +578,132 @@ async def search_patents(request: SearchRequest, background_tasks: BackgroundTas
 @app.get("/status/{task_id}", response_model=TaskStatus)
 async def get_task_status(task_id: str):
     """Get the status of a search task"""
-    if task_id not in tasks:
+    task = await _get_task(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    task = tasks[task_id]
+    # Results are stored pre-serialized, send them without decoding and re-encoding
+    if "result" in task:
+        return Response(content=_task_status_json(task_id, task), media_type="application/json")
 
-    return TaskStatus(
-        task_id=task_id,
-        status=task["status"],
-        progress=task.get("progress"),
-        result=task.get("result"),
-        error=task.get("error")
-    )
+    return _task_status(task_id, task)
+
+
+@app.get("/stream/{task_id}")
+async def stream_task_status(task_id: str):
+    """Stream status changes of a search task as Server-Sent Events"""
+    if not await redis_client.exists(_task_key(task_id)):
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    async def events():
+        pubsub = redis_client.pubsub()
+        # Subscribe before reading the current state so no update is missed
+        await pubsub.subscribe(_task_channel(task_id))
+        try:
+            task = await _get_task(task_id)
+            while task is not None:
+                yield {"data": _task_status_json(task_id, task).decode()}
+                if task["status"] in FINISHED_STATUSES:
+                    break
+
+                # Wait for the next update announcement, then send the fresh state
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        break
+                task = await _get_task(task_id)
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+    return EventSourceResponse(events())
+
+
+@app.get("/download/{task_id}/{which}")
+async def download_result_file(task_id: str, which: str):
+    """
+    Download a result file of a completed task ("json_complete" or "summary")
+
+    Files live on the local disk of the host that ran the search, so this only
+    works on a single host or with storage shared between replicas
+    """
+    task = await _get_task(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    files = orjson.loads(task["result"]).get("files", {}) if "result" in task else {}
+    if which not in files:
+        raise HTTPException(status_code=404, detail=f"No '{which}' file for this task")
+
+    path = Path(files[which])
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="Result file no longer available")
+
+    # FileResponse streams the file from disk instead of loading it into memory
+    return FileResponse(path, media_type="application/json", filename=path.name)
 
 
 @app.get("/tasks")
 async def list_tasks():
     """List all search tasks"""
-    return {
+    global _tasks_cache, _tasks_cache_version, _tasks_cache_expires_at
+
+    # Task status changes bump the version (tasks may be updated by other processes)
+    version = await redis_client.get(TASKS_VERSION)
+    if (_tasks_cache is not None and version == _tasks_cache_version
+            and time.time() < _tasks_cache_expires_at):
+        return Response(content=_tasks_cache, media_type="application/json")
+
+    # Scores are last update times; each update also resets the task TTL
+    index = await redis_client.zrange(TASKS_INDEX, 0, -1, withscores=True)
+    task_ids = [task_id for task_id, _ in index]
+    last_updates = dict(index)
+
+    # Fetch status/created_at of every task in a single round-trip
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for task_id in task_ids:
+            pipe.hmget(_task_key(task_id), "status", "created_at")
+        rows = await pipe.execute()
+
+    tasks = []
+    expired = []
+    for task_id, (status, created_at) in zip(task_ids, rows):
+        if status is None:
+            expired.append(task_id)
+            continue
+        tasks.append({
+            "task_id": task_id,
+            "status": status,
+            "created_at": created_at
+        })
+
+    # Drop index entries whose task hash has expired
+    if expired:
+        await redis_client.zrem(TASKS_INDEX, *expired)
+
+    tasks.sort(key=lambda task: task["created_at"] or "")
+
+    _tasks_cache = orjson.dumps({
         "total": len(tasks),
-        "tasks": [
-            {
-                "task_id": task_id,
-                "status": task["status"],
-                "created_at": task["created_at"]
-            }
-            for task_id, task in tasks.items()
-        ]
-    }
+        "tasks": tasks
+    })
+    _tasks_cache_version = version
+    # The least recently updated listed task is the first one to expire
+    _tasks_cache_expires_at = min(
+        (last_updates[task["task_id"]] + TASK_TTL for task in tasks),
+        default=float("inf")
+    )
+
+    return Response(content=_tasks_cache, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Multiple workers need the app as an import string; uvloop is not available on Windows
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == 'win32' else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count()))
+    )
@@ -8,6 +8,22 @@ import requests
 import time
 import json
 import sys
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session():
+    """Create a keep-alive HTTP session so all calls reuse the same connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 
 def test_api(base_url):
     """Test the PatentScope API"""
@@ -15,10 +31,12 @@ def test_api(base_url):
     print(f"  Testing PatentScope API: {base_url}")
     print("=" * 70)
 
+    session = create_session()
+
     try:
         # 1. Health check
         print("\n1️⃣  Testing health endpoint...")
-        response = requests.get(f"{base_url}/health", timeout=10)
+        response = session.get(f"{base_url}/health", timeout=10)
         print(f"   ✅ Status: {response.status_code}")
         print(f"   Response: {json.dumps(response.json(), indent=2)}")
     except Exception as e:
@@ -28,7 +46,7 @@ def test_api(base_url):
     try:
         # 2. API info
         print("\n2️⃣  Testing root endpoint...")
-        response = requests.get(f"{base_url}/", timeout=10)
+        response = session.get(f"{base_url}/", timeout=10)
         print(f"   ✅ Status: {response.status_code}")
         data = response.json()
         print(f"   Message: {data['message']}")
@@ -48,7 +66,7 @@ def test_api(base_url):
         }
 
         print(f"   Search parameters: {json.dumps(search_data, indent=2)}")
-        response = requests.post(f"{base_url}/search", json=search_data, timeout=10)
+        response = session.post(f"{base_url}/search", json=search_data, timeout=10)
         print(f"   ✅ Status: {response.status_code}")
         result = response.json()
         print(f"   Task ID: {result['task_id']}")
@@ -59,63 +77,67 @@ def test_api(base_url):
         print(f"   ❌ Error: {e}")
         return False
 
-    # 4. Poll for results
-    print("\n4️⃣  Checking search status...")
+    # 4. Stream status updates
+    print("\n4️⃣  Streaming search status...")
     print("   (This may take 30-60 seconds...)")
-    max_attempts = 60  # 5 minutes max
-    attempt = 0
-
-    while attempt < max_attempts:
-        try:
-            response = requests.get(f"{base_url}/status/{task_id}", timeout=10)
-            data = response.json()
-
-            status_msg = f"   Attempt {attempt + 1}/60: Status = {data['status']}"
-            if data.get('progress'):
-                status_msg += f" | {data['progress']}"
-            print(status_msg)
-
-            if data["status"] == "completed":
-                print("\n   ✅ Search completed!")
-                print(f"   Total patents found: {data['result']['total_patents']}")
-
-                stats = data['result']['statistics']
-                print(f"\n   📊 Statistics:")
-                print(f"   - Countries: {stats['por_pais']}")
-                print(f"   - Years: {stats['por_ano']}")
-                print(f"   - Unique applicants: {len(stats['top_applicants'])}")
-                print(f"   - Unique inventors: {len(stats['top_inventors'])}")
-
-                if data['result']['patents']:
-                    print(f"\n   📄 First patent:")
-                    patent = data['result']['patents'][0]
-                    print(f"   - Number: {patent.get('publicationNumber', 'N/A')}")
-                    print(f"   - Title: {patent.get('title', 'N/A')[:70]}...")
-                    print(f"   - Date: {patent.get('publicationDate', 'N/A')}")
-                    print(f"   - Applicants: {', '.join(patent.get('applicants', ['N/A'])[:2])}")
-
-                break
-            elif data["status"] == "failed":
-                print(f"\n   ❌ Search failed!")
-                print(f"   Error: {data.get('error', 'Unknown error')}")
-                return False
-
-            attempt += 1
-            time.sleep(5)
-
-        except Exception as e:
-            print(f"   ⚠️  Error checking status: {e}")
-            attempt += 1
-            time.sleep(5)
-
-    if attempt >= max_attempts:
+    deadline = time.monotonic() + 300  # 5 minutes max
+    data = None
+
+    try:
+        with session.get(f"{base_url}/stream/{task_id}", stream=True, timeout=(10, 60)) as response:
+            response.raise_for_status()
+
+            # Server-Sent Events: one "data: {json}" line per status change
+            for line in response.iter_lines(decode_unicode=True):
+                if time.monotonic() > deadline:
+                    break
+                if not line or not line.startswith("data:"):
+                    continue
+
+                data = json.loads(line[len("data:"):])
+
+                status_msg = f"   Status = {data['status']}"
+                if data.get('progress'):
+                    status_msg += f" | {data['progress']}"
+                print(status_msg)
+
+                if data["status"] in ("completed", "failed"):
+                    break
+    except Exception as e:
+        print(f"   ❌ Error streaming status: {e}")
+        return False
+
+    if data is None or data["status"] not in ("completed", "failed"):
         print("\n   ⚠️  Timeout waiting for results (exceeded 5 minutes)")
         return False
 
+    if data["status"] == "failed":
+        print(f"\n   ❌ Search failed!")
+        print(f"   Error: {data.get('error', 'Unknown error')}")
+        return False
+
+    print("\n   ✅ Search completed!")
+    print(f"   Total patents found: {data['result']['total_patents']}")
+
+    stats = data['result']['statistics']
+    print(f"\n   📊 Statistics:")
+    print(f"   - Countries: {stats['por_pais']}")
+    print(f"   - Years: {stats['por_ano']}")
+    print(f"   - Unique applicants: {len(stats['top_applicants'])}")
+    print(f"   - Unique inventors: {len(stats['top_inventors'])}")
+
+    if data['result']['patents']:
+        print(f"\n   📄 First patent:")
+        patent = data['result']['patents'][0]
+        print(f"   - Number: {patent.get('publicationNumber', 'N/A')}")
+        print(f"   - Title: {patent.get('title', 'N/A')[:70]}...")
+        print(f"   - Date: {patent.get('publicationDate', 'N/A')}")
+        print(f"   - Applicants: {', '.join(patent.get('applicants', ['N/A'])[:2])}")
+
     # 5. List all tasks
     try:
         print("\n5️⃣  Listing all tasks...")
-        response = requests.get(f"{base_url}/tasks", timeout=10)
+        response = session.get(f"{base_url}/tasks", timeout=10)
         tasks_data = response.json()
         print(f"   ✅ Total tasks: {tasks_data['total']}")
         for task in tasks_data['tasks'][:3]:  # Show first 3
@@ -123,6 +145,16 @@ def test_api(base_url):
     except Exception as e:
         print(f"   ⚠️  Error listing tasks: {e}")
 
+    # 6. Download result file
+    try:
+        print("\n6️⃣  Downloading complete results file...")
+        response = session.get(f"{base_url}/download/{task_id}/json_complete", timeout=30)
+        response.raise_for_status()
+        print(f"   ✅ Status: {response.status_code}")
+        print(f"   Patents in file: {len(response.json())} ({len(response.content)} bytes)")
+    except Exception as e:
+        print(f"   ⚠️  Error downloading results: {e}")
+
     print("\n" + "=" * 70)
     print("  ✅ ALL TESTS PASSED!")
     print("=" * 70)